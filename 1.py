@@ -10,18 +10,27 @@ Dodger — Pygame 2D 躲避小游戏（单文件，无外部素材）
 - 无外部图片/字体/音效依赖，纯代码绘制
 
 运行：
-    pip install pygame
+    pip install pygame numpy
     python dodger_game.py
 """
 
 import sys, os, json, random, math, time
+import numpy as np
 import pygame
+from pygame._sdl2.video import Window, Renderer, Texture
+
+try:
+    from numba import njit   # 可选加速：缺失时退回 NumPy 向量化路径
+except ImportError:
+    njit = None
 
 # -----------------------------
 # 配置
 # -----------------------------
 WIDTH, HEIGHT = 960, 540         # 窗口尺寸（16:9）
-FPS = 60                         # 帧率
+FPS = 60                         # 渲染帧率上限
+DT_FIX = 1 / 120                 # 固定模拟步长（秒）：物理与渲染解耦
+MAX_FRAME_TIME = 0.25            # 单帧最大推进量，防止卡顿后追帧螺旋
 PLAYER_SIZE = 36                 # 玩家方块边长
 ENEMY_SIZE = 28                  # 敌人方块边长
 POWERUP_SIZE = 22                # 道具尺寸
@@ -37,6 +46,8 @@ SPAWN_ACCEL_TIME = 60            # 难度加速时间（越长下降越慢）
 ENEMY_SPEED_BASE = 180           # 敌人基础速度（像素/秒）
 ENEMY_SPEED_MAX = 560            # 敌人最大速度（像素/秒）
 POWERUP_INTERVAL = (6, 11)       # 道具掉落间隔范围（秒）
+MAX_ENEMIES = 512                # 敌人池容量（预分配，稳态零分配）
+MAX_POWERUPS = 32                # 道具池容量
 HIGH_SCORE_FILE = "highscore.json"
 
 # 颜色（深蓝/亮蓝/金色主题）
@@ -82,23 +93,47 @@ def choose_font(size):
     return pygame.font.Font(None, size)
 
 def draw_vgradient(surf, top_color, bottom_color):
-    # 垂直渐变背景（GPU 友好：预渲染一次即可）
-    h = surf.get_height()
-    for y in range(h):
-        t = y / (h - 1)
-        r = int(top_color[0] * (1 - t) + bottom_color[0] * t)
-        g = int(top_color[1] * (1 - t) + bottom_color[1] * t)
-        b = int(top_color[2] * (1 - t) + bottom_color[2] * t)
-        pygame.draw.line(surf, (r, g, b), (0, y), (surf.get_width(), y))
-
-def glow_rect(surface, rect, color, radius=10, alpha=70):
-    # 简易发光矩形（半透明外圈）
-    temp = pygame.Surface((rect.width + radius*4, rect.height + radius*4), pygame.SRCALPHA)
-    pygame.draw.rect(temp, (*color, alpha), (radius*2, radius*2, rect.width, rect.height), border_radius=12)
-    surface.blit(temp, (rect.x - radius*2, rect.y - radius*2))
-
-def clamp(v, lo, hi):
-    return max(lo, min(hi, v))
+    # 垂直渐变背景（预渲染一次即可）：NumPy 广播一次算出整幅 (H,W,3)，
+    # 再用 blit_array 整体拷入，取代逐行 draw.line 的 Python 循环
+    h, w = surf.get_height(), surf.get_width()
+    t = np.linspace(0.0, 1.0, h, dtype=np.float32)[:, None]
+    col = (np.asarray(top_color, dtype=np.float32) * (1 - t) +
+           np.asarray(bottom_color, dtype=np.float32) * t).astype(np.uint8)
+    arr = np.broadcast_to(col[:, None, :], (h, w, 3)).copy()
+    pygame.surfarray.blit_array(surf, arr.swapaxes(0, 1))
+
+# 9 种输入方向的归一化向量查找表（对角线 = 1/√2）：
+# hypot/除法在 import 时各算一次，热路径里只剩一次字典查找
+INPUT_DIRS = {(x, y): (x / math.hypot(x, y), y / math.hypot(x, y)) if (x or y) else (0.0, 0.0)
+              for x in (-1, 0, 1) for y in (-1, 0, 1)}
+
+def step_enemies(pos, vy, drift, count, dt, esize, px, py, psize):
+    # 敌人推进融合内核：移动 + 反弹 + 出屏压缩 + 与玩家的 AABB 测试
+    # 在一次循环里完成（NumPy 分步写法要为每一步都物化临时数组）。
+    # numba 可用时会被 njit 编译成单个 C 循环（见下），否则不会被调用。
+    # 返回 (压缩后的数量, 命中玩家的槽位或 -1)。
+    m = 0
+    hit = -1
+    for i in range(count):
+        d = drift[i]
+        x = pos[i, 0] + d * dt
+        y = pos[i, 1] + vy[i] * dt
+        if y > HEIGHT:
+            continue  # 出屏，压缩掉
+        if x < 0.0 or x > WIDTH - esize:
+            d = -d  # 反弹
+        pos[m, 0] = x
+        pos[m, 1] = y
+        vy[m] = vy[i]
+        drift[m] = d
+        if hit < 0 and (x < px + psize and x + esize > px and
+                        y < py + psize and y + esize > py):
+            hit = m
+        m += 1
+    return m, hit
+
+if njit is not None:
+    step_enemies = njit(cache=True, fastmath=True)(step_enemies)
 
 # -----------------------------
 # 实体
@@ -107,6 +142,10 @@ class Player:
     def __init__(self):
         self.size = PLAYER_SIZE
         self.rect = pygame.Rect(WIDTH//2 - self.size//2, HEIGHT - self.size*2, self.size, self.size)
+        # 亚像素位置累加器：rect 只是取整视图，位移先累加在 float 上，
+        # 否则固定小步长下每步 int() 截断会吃掉大量位移（见 update）
+        self.x = float(self.rect.x)
+        self.y = float(self.rect.y)
         self.speed = PLAYER_SPEED
         self.invincible_until = 0.0
         self.has_shield = False
@@ -116,36 +155,39 @@ class Player:
     def start(self):
         self.rect.centerx = WIDTH // 2
         self.rect.bottom = HEIGHT - 16
+        self.x = float(self.rect.x)
+        self.y = float(self.rect.y)
         self.invincible_until = 0
         self.dash_until = 0
         self.dash_cd_until = 0
         self.has_shield = False
 
     def update(self, dt, keys, now):
-        vx = vy = 0.0
-        if keys[pygame.K_a] or keys[pygame.K_LEFT]:
-            vx -= 1
-        if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
-            vx += 1
-        if keys[pygame.K_w] or keys[pygame.K_UP]:
-            vy -= 1
-        if keys[pygame.K_s] or keys[pygame.K_DOWN]:
-            vy += 1
+        # 无分支输入轴：按键布尔值直接做减法得到 -1/0/1
+        vx = (keys[pygame.K_d] | keys[pygame.K_RIGHT]) - (keys[pygame.K_a] | keys[pygame.K_LEFT])
+        vy = (keys[pygame.K_s] | keys[pygame.K_DOWN]) - (keys[pygame.K_w] | keys[pygame.K_UP])
 
         spd = self.speed
         if now < self.dash_until:
             spd = DASH_SPEED
 
-        # 归一化斜向速度
-        if vx or vy:
-            mag = math.hypot(vx, vy)
-            vx, vy = vx/mag, vy/mag
-        self.rect.x += int(vx * spd * dt)
-        self.rect.y += int(vy * spd * dt)
+        # 归一化斜向速度（查表，见 INPUT_DIRS）
+        vx, vy = INPUT_DIRS[(vx, vy)]
+        self.x += vx * spd * dt
+        self.y += vy * spd * dt
+
+        # 边界（内联分支：玩家大多在屏幕中间，几乎总是直接跳过）
+        if self.x < 0.0:
+            self.x = 0.0
+        elif self.x > WIDTH - self.size:
+            self.x = float(WIDTH - self.size)
+        if self.y < 0.0:
+            self.y = 0.0
+        elif self.y > HEIGHT - self.size:
+            self.y = float(HEIGHT - self.size)
 
-        # 边界
-        self.rect.x = clamp(self.rect.x, 0, WIDTH - self.size)
-        self.rect.y = clamp(self.rect.y, 0, HEIGHT - self.size)
+        self.rect.x = int(self.x)
+        self.rect.y = int(self.y)
 
     def try_dash(self, now):
         if now >= self.dash_cd_until:
@@ -164,76 +206,86 @@ class Player:
             return False  # 护盾抵消一次
         return True  # 实际受伤（本作为一击淘汰）
 
-    def draw(self, surf, now):
-        # 主体
-        col = C_GOLD if now < self.dash_until else C_WHITE
-        pygame.draw.rect(surf, col, self.rect, border_radius=8)
-        # 护盾环
-        if self.has_shield:
-            pygame.draw.rect(surf, C_GLOW, self.rect.inflate(10, 10), width=3, border_radius=12)
-        # 无敌闪烁
-        if now < self.invincible_until and int(now*20) % 2 == 0:
-            pygame.draw.rect(surf, (255, 255, 255, 120), self.rect, border_radius=8)
-
-class Enemy:
-    def __init__(self, speed):
-        self.size = ENEMY_SIZE
-        x = random.randint(0, WIDTH - self.size)
-        y = -self.size - random.randint(0, 200)
-        self.rect = pygame.Rect(x, y, self.size, self.size)
-        self.speed = speed
-        self.drift = random.uniform(-60, 60)  # 水平小幅漂移
-
-    def update(self, dt):
-        self.rect.y += int(self.speed * dt)
-        self.rect.x += int(self.drift * dt)
-        if self.rect.left < 0 or self.rect.right > WIDTH:
-            self.drift = -self.drift  # 反弹
-        return self.rect.top <= HEIGHT
-
-    def draw(self, surf):
-        pygame.draw.rect(surf, C_RED, self.rect, border_radius=6)
-
-class PowerUp:
-    TYPES = ("shield",)  # 可扩展：slowmo/clear 等
-
-    def __init__(self):
-        self.kind = random.choice(self.TYPES)
-        self.rect = pygame.Rect(
-            random.randint(20, WIDTH - 20 - POWERUP_SIZE),
-            -POWERUP_SIZE - random.randint(40, 200),
-            POWERUP_SIZE, POWERUP_SIZE
-        )
-        self.speed = random.uniform(120, 200)
-
-    def update(self, dt):
-        self.rect.y += int(self.speed * dt)
-        return self.rect.top <= HEIGHT
-
-    def draw(self, surf):
-        if self.kind == "shield":
-            pygame.draw.rect(surf, C_GLOW, self.rect, border_radius=8)
-            pygame.draw.rect(surf, C_WHITE, self.rect, width=2, border_radius=8)
+# 敌人/道具采用 SoA（Structure of Arrays）存储：
+# 位置/速度/漂移分别放在连续的 float32 数组里，每帧用 NumPy 向量化
+# 一次性完成移动、反弹和出屏裁剪，取代逐对象的 Python 属性访问。
+# 道具目前只有护盾一种（可扩展：slowmo/clear 等需加 kind 数组）。
 
 # -----------------------------
 # 游戏主类
 # -----------------------------
 class Game:
+    # 1024 项正弦查找表：热路径里用数组索引 + 整数掩码取代 libm 调用
+    _SIN = tuple(math.sin(i * 2 * math.pi / 1024) for i in range(1024))
+
+    def _sin(self, x):
+        return self._SIN[int(x * (1024 / (2 * math.pi))) & 1023]
+
+    def _cos(self, x):
+        # cos(x) = sin(x + π/2)，即查表偏移 1/4 周期
+        return self._SIN[(int(x * (1024 / (2 * math.pi))) + 256) & 1023]
+
     def __init__(self):
         pygame.init()
-        pygame.display.set_caption("Dodger — Python 2D 小游戏")
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        # 硬件加速渲染：Window + Renderer，精灵上传为 Texture，
+        # 同一纹理的多次 draw 由 SDL 合并成一次 GPU 提交
+        self.window = Window("Dodger — Python 2D 小游戏", size=(WIDTH, HEIGHT))
+        try:
+            self.renderer = Renderer(self.window, accelerated=1)
+        except RuntimeError:  # pygame.error 与 _sdl2 的 error 都派生自 RuntimeError
+            # 无硬件加速驱动时让 SDL 自选可用渲染器（接口一致）
+            self.renderer = Renderer(self.window)
         self.clock = pygame.time.Clock()
 
-        # 背景预渲染
-        self.bg = pygame.Surface((WIDTH, HEIGHT))
-        draw_vgradient(self.bg, C_BG_TOP, C_BG_BOTTOM)
+        # 背景预渲染（渐变算好后整体上传为纹理）
+        bg = pygame.Surface((WIDTH, HEIGHT))
+        draw_vgradient(bg, C_BG_TOP, C_BG_BOTTOM)
+        self.bg_tex = Texture.from_surface(self.renderer, bg)
 
         # 字体
         self.font_big = choose_font(48)
         self.font_mid = choose_font(28)
         self.font_small = choose_font(20)
 
+        # 预渲染精灵：圆角矩形只光栅化一次，上传为纹理后逐帧直接 draw
+        self.enemy_tex = self._rounded_tex(ENEMY_SIZE, C_RED, border_radius=6)
+
+        powerup_surf = pygame.Surface((POWERUP_SIZE, POWERUP_SIZE), pygame.SRCALPHA)
+        pygame.draw.rect(powerup_surf, C_GLOW, powerup_surf.get_rect(), border_radius=8)
+        pygame.draw.rect(powerup_surf, C_WHITE, powerup_surf.get_rect(), width=2, border_radius=8)
+        self.powerup_tex = Texture.from_surface(self.renderer, powerup_surf)
+
+        # 玩家：普通/冲刺两种配色 + 护盾环 + 无敌闪烁覆盖层
+        self.player_tex = self._rounded_tex(PLAYER_SIZE, C_WHITE, border_radius=8)
+        self.player_dash_tex = self._rounded_tex(PLAYER_SIZE, C_GOLD, border_radius=8)
+        self.player_flash_tex = self._rounded_tex(PLAYER_SIZE, (255, 255, 255), border_radius=8)
+        ring = pygame.Surface((PLAYER_SIZE + 10, PLAYER_SIZE + 10), pygame.SRCALPHA)
+        pygame.draw.rect(ring, C_GLOW, ring.get_rect(), width=3, border_radius=12)
+        self.shield_ring_tex = Texture.from_surface(self.renderer, ring)
+
+        # 发光面板（几何固定，只有位置在动）
+        glow = pygame.Surface((220 + 40, 140 + 40), pygame.SRCALPHA)
+        pygame.draw.rect(glow, (*C_GLOW, 40), (20, 20, 220, 140), border_radius=12)
+        self.glow_tex = Texture.from_surface(self.renderer, glow)
+
+        # 中央面板底板（暂停/提示用）
+        panel = pygame.Surface((min(640, WIDTH - 120), 240), pygame.SRCALPHA)
+        pygame.draw.rect(panel, (0, 0, 0, 140), panel.get_rect(), border_radius=16)
+        self.panel_tex = Texture.from_surface(self.renderer, panel)
+
+        # 文本纹理缓存（见 _txt）
+        self._txt_cache = {}
+        # HUD 脏标记缓存（见 draw_hud）
+        self._hud_key = None
+        self._hud_items = ()
+
+        # 难度查找表：生成间隔从 SPAWN_BASE_INTERVAL 逐渐逼近 SPAWN_MIN_INTERVAL
+        self._diff_table = []
+        for s in range(SPAWN_ACCEL_TIME + 1):
+            k = s / SPAWN_ACCEL_TIME  # s ∈ [0, SPAWN_ACCEL_TIME]，天然在 [0,1] 内
+            self._diff_table.append((SPAWN_BASE_INTERVAL * (1 - k) + SPAWN_MIN_INTERVAL * k,
+                                     ENEMY_SPEED_BASE * (1 - k) + ENEMY_SPEED_MAX * k))
+
         # 音效（可选）
         self.beep = None
         try:
@@ -242,17 +294,46 @@ class Game:
         except Exception:
             pass
 
+        # 实体池：SoA 数组按上限一次性预分配，跨局复用，
+        # spawn/cull 只移动 count 游标，稳态下零堆分配
+        self.enemy_pos = np.zeros((MAX_ENEMIES, 2), dtype=np.float32)
+        self.enemy_vy = np.zeros(MAX_ENEMIES, dtype=np.float32)
+        self.enemy_drift = np.zeros(MAX_ENEMIES, dtype=np.float32)
+        self.powerup_pos = np.zeros((MAX_POWERUPS, 2), dtype=np.float32)
+        self.powerup_vy = np.zeros(MAX_POWERUPS, dtype=np.float32)
+        if njit is not None:
+            # 空调用触发 JIT 编译，把首次编译开销留在启动期而不是第一帧
+            step_enemies(self.enemy_pos, self.enemy_vy, self.enemy_drift,
+                         0, 0.0, ENEMY_SIZE, 0, 0, 0)
+
         # 状态
         self.state = S_MENU
+        self._now = time.perf_counter()  # 每帧在 run 里刷新一次
         self.reset()
 
         self.high_score = load_high_score()
 
+    def _rounded_tex(self, size, color, border_radius):
+        surf = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.rect(surf, color, surf.get_rect(), border_radius=border_radius)
+        return Texture.from_surface(self.renderer, surf)
+
+    def _txt(self, font, s, color):
+        # 按 (字体, 字符串, 颜色) 缓存：相同文本永远命中，零光栅化开销；
+        # 分数每涨 1 分至多 miss 一次，冷却倒计时等循环出现的串全部复用
+        key = (id(font), s, color)
+        tex = self._txt_cache.get(key)
+        if tex is None:
+            tex = Texture.from_surface(self.renderer, font.render(s, True, color))
+            self._txt_cache[key] = tex
+        return tex
+
     def reset(self):
         self.player = Player()
         self.player.start()
-        self.enemies = []
-        self.powerups = []
+        # 敌人/道具 SoA：数组在 __init__ 预分配，这里只清游标
+        self.enemy_count = 0
+        self.powerup_count = 0
         self.score = 0.0
         self.start_time = time.perf_counter()
         self.last_spawn = 0.0
@@ -261,34 +342,60 @@ class Game:
 
     def difficulty(self, t):
         # t：开局到现在的秒数 -> 动态难度曲线
-        # 生成间隔从 SPAWN_BASE_INTERVAL 逐渐逼近 SPAWN_MIN_INTERVAL
-        k = clamp(t / SPAWN_ACCEL_TIME, 0.0, 1.0)
-        spawn = SPAWN_BASE_INTERVAL * (1 - k) + SPAWN_MIN_INTERVAL * k
-        speed = ENEMY_SPEED_BASE * (1 - k) + ENEMY_SPEED_MAX * k
-        return spawn, speed
+        # 曲线平滑且每帧采样多次，预先按秒制成查找表（见 __init__），
+        # 这里退化成一次 min + 下标访问
+        i = int(t)
+        if i < 0:
+            i = 0
+        elif i > SPAWN_ACCEL_TIME:
+            i = SPAWN_ACCEL_TIME
+        return self._diff_table[i]
 
     def spawn_enemy(self, speed):
-        self.enemies.append(Enemy(speed))
+        n = self.enemy_count
+        if n >= MAX_ENEMIES:
+            return  # 池满即丢弃（512 个同屏敌人早已必死无疑）
+        self.enemy_pos[n, 0] = random.randint(0, WIDTH - ENEMY_SIZE)
+        self.enemy_pos[n, 1] = -ENEMY_SIZE - random.randint(0, 200)
+        self.enemy_vy[n] = speed
+        self.enemy_drift[n] = random.uniform(-60, 60)  # 水平小幅漂移
+        self.enemy_count = n + 1
 
     def spawn_powerup(self):
-        self.powerups.append(PowerUp())
-
-    def handle_collisions(self, now):
-        # 敌人与玩家
-        for e in list(self.enemies):
-            if self.player.rect.colliderect(e.rect):
-                if self.player.hit(now):
-                    self.game_over()
-                else:
-                    # 被护盾抵消，删除该敌人
-                    self.enemies.remove(e)
-
-        # 道具
-        for p in list(self.powerups):
-            if self.player.rect.colliderect(p.rect):
-                if p.kind == "shield":
-                    self.player.has_shield = True
-                self.powerups.remove(p)
+        n = self.powerup_count
+        if n >= MAX_POWERUPS:
+            return
+        self.powerup_pos[n, 0] = random.randint(20, WIDTH - 20 - POWERUP_SIZE)
+        self.powerup_pos[n, 1] = -POWERUP_SIZE - random.randint(40, 200)
+        self.powerup_vy[n] = random.uniform(120, 200)
+        self.powerup_count = n + 1
+
+    def remove_enemy(self, i):
+        # 末位交换删除（绘制的是同色方块，顺序无关紧要）
+        n = self.enemy_count - 1
+        self.enemy_pos[i] = self.enemy_pos[n]
+        self.enemy_vy[i] = self.enemy_vy[n]
+        self.enemy_drift[i] = self.enemy_drift[n]
+        self.enemy_count = n
+
+    def remove_powerup(self, i):
+        n = self.powerup_count - 1
+        self.powerup_pos[i] = self.powerup_pos[n]
+        self.powerup_vy[i] = self.powerup_vy[n]
+        self.powerup_count = n
+
+    def handle_powerups(self, now):
+        px, py, ps = self.player.rect.x, self.player.rect.y, self.player.size
+
+        # 道具（拾取即获得护盾）：对 SoA 数组做向量化 AABB 测试
+        n = self.powerup_count
+        if n:
+            x, y = self.powerup_pos[:n, 0], self.powerup_pos[:n, 1]
+            hit = ((x < px + ps) & (x + POWERUP_SIZE > px) &
+                   (y < py + ps) & (y + POWERUP_SIZE > py))
+            if hit.any():
+                self.player.has_shield = True
+                self.remove_powerup(int(np.argmax(hit)))
 
     def game_over(self):
         self.state = S_GAMEOVER
@@ -298,10 +405,7 @@ class Game:
             self.high_score = final_score
             save_high_score(final_score)
 
-    def update(self, dt):
-        now = time.perf_counter()
-        keys = pygame.key.get_pressed()
-
+    def update(self, dt, now, keys):
         if self.state == S_PLAY:
             # 玩家
             self.player.update(dt, keys, now)
@@ -326,49 +430,121 @@ class Game:
                 self.spawn_powerup()
                 self.next_powerup_t = elapsed + random.uniform(*POWERUP_INTERVAL)
 
-            # 更新敌人/道具
-            self.enemies = [e for e in self.enemies if e.update(dt)]
-            self.powerups = [p for p in self.powerups if p.update(dt)]
-
-            # 碰撞
-            self.handle_collisions(now)
+            # 更新敌人：numba 可用时走融合内核（移动/反弹/裁剪/碰撞一次循环），
+            # 否则退回分步的 NumPy 向量化
+            px, py, ps = self.player.rect.x, self.player.rect.y, self.player.size
+            hit_idx = -1
+            n = self.enemy_count
+            if n:
+                if njit is not None:
+                    self.enemy_count, hit_idx = step_enemies(
+                        self.enemy_pos, self.enemy_vy, self.enemy_drift,
+                        n, dt, ENEMY_SIZE, px, py, ps)
+                else:
+                    pos = self.enemy_pos[:n]
+                    pos[:, 1] += self.enemy_vy[:n] * dt
+                    pos[:, 0] += self.enemy_drift[:n] * dt
+                    bounce = (pos[:, 0] < 0) | (pos[:, 0] > WIDTH - ENEMY_SIZE)
+                    self.enemy_drift[:n][bounce] *= -1  # 反弹
+                    alive = pos[:, 1] <= HEIGHT
+                    if not alive.all():
+                        m = int(alive.sum())
+                        self.enemy_pos[:m] = pos[alive]
+                        self.enemy_vy[:m] = self.enemy_vy[:n][alive]
+                        self.enemy_drift[:m] = self.enemy_drift[:n][alive]
+                        self.enemy_count = m
+                    n = self.enemy_count
+                    # 宽相位剪枝：按 PLAYER_SIZE*2 的均匀网格取玩家 3×3 邻域
+                    # 内的候选（敌人边长 < 格边长，邻域必然覆盖所有可能重叠），
+                    # 精确 AABB 只在候选上做，敌人再多候选也只有十几个格子的量
+                    cell = PLAYER_SIZE * 2
+                    ex, ey = self.enemy_pos[:n, 0], self.enemy_pos[:n, 1]
+                    near = ((np.abs(ex // cell - px // cell) <= 1) &
+                            (np.abs(ey // cell - py // cell) <= 1))
+                    if near.any():
+                        cand = np.where(near)[0]
+                        cx, cy = ex[cand], ey[cand]
+                        hit = ((cx < px + ps) & (cx + ENEMY_SIZE > px) &
+                               (cy < py + ps) & (cy + ENEMY_SIZE > py))
+                        if hit.any():
+                            hit_idx = int(cand[np.argmax(hit)])  # 取确定的第一个
+            if hit_idx >= 0:
+                if self.player.hit(now):
+                    self.game_over()
+                else:
+                    # 被护盾抵消，删除命中的敌人
+                    self.remove_enemy(hit_idx)
+            n = self.powerup_count
+            if n:
+                self.powerup_pos[:n, 1] += self.powerup_vy[:n] * dt
+                alive = self.powerup_pos[:n, 1] <= HEIGHT
+                if not alive.all():
+                    m = int(alive.sum())
+                    self.powerup_pos[:m] = self.powerup_pos[:n][alive]
+                    self.powerup_vy[:m] = self.powerup_vy[:n][alive]
+                    self.powerup_count = m
+
+            # 道具碰撞
+            self.handle_powerups(now)
 
             # 计分：生存时间 * 10 + 轻微基于难度的奖励
-            self.score = elapsed * 10 + max(0, (len(self.enemies) - 4))
+            self.score = elapsed * 10 + max(0, (self.enemy_count - 4))
 
     def draw_hud(self):
-        # 分数
-        score_txt = self.font_mid.render(f"Score  {int(self.score)}", True, C_WHITE)
-        self.screen.blit(score_txt, (16, 12))
-        # 最高分
-        hs_txt = self.font_small.render(f"Best  {self.high_score}", True, C_DIM)
-        self.screen.blit(hs_txt, (18, 48))
-        # 冲刺冷却
-        now = time.perf_counter()
-        cd_left = max(0.0, self.player.dash_cd_until - now)
-        dash_info = "Dash Ready" if cd_left <= 0.0 else f"Dash {cd_left:.1f}s"
-        dash_txt = self.font_small.render(dash_info, True, C_GLOW if cd_left <= 0.0 else C_DIM)
-        self.screen.blit(dash_txt, (16, HEIGHT - 36))
-        # 提示
-        tip = self.font_small.render("WASD/←→↑↓ 移动 | Space 冲刺 | P 暂停", True, C_DIM)
-        self.screen.blit(tip, (WIDTH - tip.get_width() - 16, HEIGHT - 36))
+        # 脏标记：分数/最高分/冷却（0.1s 粒度，与显示精度一致）任一变化
+        # 才重建条目列表，其余帧直接按缓存的 (纹理, 目标矩形) 绘制
+        cd_left = max(0.0, self.player.dash_cd_until - self._now)
+        key = (int(self.score), self.high_score, int(cd_left * 10))
+        if key != self._hud_key:
+            self._hud_key = key
+            # 分数
+            score = self._txt(self.font_mid, f"Score  {key[0]}", C_WHITE)
+            # 最高分
+            hs = self._txt(self.font_small, f"Best  {key[1]}", C_DIM)
+            # 冲刺冷却
+            dash_info = "Dash Ready" if cd_left <= 0.0 else f"Dash {cd_left:.1f}s"
+            dash = self._txt(self.font_small, dash_info,
+                             C_GLOW if cd_left <= 0.0 else C_DIM)
+            # 提示
+            tip = self._txt(self.font_small,
+                            "WASD/←→↑↓ 移动 | Space 冲刺 | P 暂停", C_DIM)
+            self._hud_items = (
+                (score, (16, 12, score.width, score.height)),
+                (hs, (18, 48, hs.width, hs.height)),
+                (dash, (16, HEIGHT - 36, dash.width, dash.height)),
+                (tip, (WIDTH - tip.width - 16, HEIGHT - 36, tip.width, tip.height)),
+            )
+        for tex, dst in self._hud_items:
+            tex.draw(dstrect=dst)
+
+    def draw_player(self, now):
+        r = self.player.rect
+        tex = self.player_dash_tex if now < self.player.dash_until else self.player_tex
+        tex.draw(dstrect=(r.x, r.y, r.w, r.h))
+        # 护盾环
+        if self.player.has_shield:
+            self.shield_ring_tex.draw(dstrect=(r.x - 5, r.y - 5, r.w + 10, r.h + 10))
+        # 无敌闪烁
+        if now < self.player.invincible_until and int(now * 20) % 2 == 0:
+            self.player_flash_tex.draw(dstrect=(r.x, r.y, r.w, r.h))
 
     def draw(self):
-        self.screen.blit(self.bg, (0, 0))
+        self.bg_tex.draw()  # dstrect=None：整屏背景
 
         if self.state in (S_PLAY, S_PAUSE):
             # 发光背景层（轻微动感）
-            t = time.perf_counter()
-            cx = WIDTH * 0.3 + math.sin(t * 0.6) * 60
-            cy = HEIGHT * 0.35 + math.cos(t * 0.7) * 40
-            glow_rect(self.screen, pygame.Rect(int(cx), int(cy), 220, 140), C_GLOW, alpha=40)
-
-            # 实体
-            for p in self.powerups:
-                p.draw(self.screen)
-            for e in self.enemies:
-                e.draw(self.screen)
-            self.player.draw(self.screen, time.perf_counter())
+            t = self._now
+            cx = WIDTH * 0.3 + self._sin(t * 0.6) * 60
+            cy = HEIGHT * 0.35 + self._cos(t * 0.7) * 40
+            self.glow_tex.draw(dstrect=(int(cx) - 20, int(cy) - 20,
+                                        self.glow_tex.width, self.glow_tex.height))
+
+            # 实体：同一纹理的连续 draw 由 SDL 批量提交
+            for x, y in self.powerup_pos[:self.powerup_count]:
+                self.powerup_tex.draw(dstrect=(int(x), int(y), POWERUP_SIZE, POWERUP_SIZE))
+            for x, y in self.enemy_pos[:self.enemy_count]:
+                self.enemy_tex.draw(dstrect=(int(x), int(y), ENEMY_SIZE, ENEMY_SIZE))
+            self.draw_player(self._now)
             self.draw_hud()
 
             if self.state == S_PAUSE:
@@ -378,42 +554,48 @@ class Game:
         elif self.state == S_GAMEOVER:
             self.draw_gameover_screen()
 
-        pygame.display.flip()
+        self.renderer.present()
 
     def draw_center_panel(self, title, subtitle, footer=None):
-        panel = pygame.Surface((min(640, WIDTH-120), 240), pygame.SRCALPHA)
-        pygame.draw.rect(panel, (0, 0, 0, 140), panel.get_rect(), border_radius=16)
-        tx = self.font_big.render(title, True, C_GOLD)
-        sx = self.font_mid.render(subtitle, True, C_WHITE)
-        panel.blit(tx, (panel.get_width()//2 - tx.get_width()//2, 40))
-        panel.blit(sx, (panel.get_width()//2 - sx.get_width()//2, 120))
+        pw, ph = self.panel_tex.width, self.panel_tex.height
+        px, py = WIDTH//2 - pw//2, HEIGHT//2 - ph//2
+        self.panel_tex.draw(dstrect=(px, py, pw, ph))
+        tx = self._txt(self.font_big, title, C_GOLD)
+        sx = self._txt(self.font_mid, subtitle, C_WHITE)
+        tx.draw(dstrect=(px + pw//2 - tx.width//2, py + 40, tx.width, tx.height))
+        sx.draw(dstrect=(px + pw//2 - sx.width//2, py + 120, sx.width, sx.height))
         if footer:
-            fx = self.font_small.render(footer, True, C_DIM)
-            panel.blit(fx, (panel.get_width()//2 - fx.get_width()//2, 180))
-        self.screen.blit(panel, (WIDTH//2 - panel.get_width()//2, HEIGHT//2 - panel.get_height()//2))
+            fx = self._txt(self.font_small, footer, C_DIM)
+            fx.draw(dstrect=(px + pw//2 - fx.width//2, py + 180, fx.width, fx.height))
 
     def draw_title_screen(self):
-        title = self.font_big.render("Dodger", True, C_GOLD)
-        tip1 = self.font_mid.render("一个用 Python+Pygame 写的 2D 躲避小游戏", True, C_WHITE)
-        tip2 = self.font_mid.render("按 Enter 开始 · Q 退出", True, C_DIM)
-        hs = self.font_small.render(f"最高分：{self.high_score}", True, C_DIM)
-        self.screen.blit(title, (WIDTH//2 - title.get_width()//2, HEIGHT*0.28))
-        self.screen.blit(tip1, (WIDTH//2 - tip1.get_width()//2, HEIGHT*0.28 + 70))
-        self.screen.blit(tip2, (WIDTH//2 - tip2.get_width()//2, HEIGHT*0.28 + 120))
-        self.screen.blit(hs, (WIDTH//2 - hs.get_width()//2, HEIGHT*0.28 + 170))
+        title = self._txt(self.font_big, "Dodger", C_GOLD)
+        tip1 = self._txt(self.font_mid,
+                              "一个用 Python+Pygame 写的 2D 躲避小游戏", C_WHITE)
+        tip2 = self._txt(self.font_mid, "按 Enter 开始 · Q 退出", C_DIM)
+        hs = self._txt(self.font_small, f"最高分：{self.high_score}", C_DIM)
+        title.draw(dstrect=(WIDTH//2 - title.width//2, int(HEIGHT*0.28), title.width, title.height))
+        tip1.draw(dstrect=(WIDTH//2 - tip1.width//2, int(HEIGHT*0.28) + 70, tip1.width, tip1.height))
+        tip2.draw(dstrect=(WIDTH//2 - tip2.width//2, int(HEIGHT*0.28) + 120, tip2.width, tip2.height))
+        hs.draw(dstrect=(WIDTH//2 - hs.width//2, int(HEIGHT*0.28) + 170, hs.width, hs.height))
 
     def draw_gameover_screen(self):
-        final = int(self.score)
-        t1 = self.font_big.render("游戏结束", True, C_GOLD)
-        t2 = self.font_mid.render(f"本局得分：{final}", True, C_WHITE)
-        t3 = self.font_mid.render("按 R 重开 · Q 退出", True, C_DIM)
-        self.screen.blit(t1, (WIDTH//2 - t1.get_width()//2, HEIGHT*0.32))
-        self.screen.blit(t2, (WIDTH//2 - t2.get_width()//2, HEIGHT*0.32 + 70))
-        self.screen.blit(t3, (WIDTH//2 - t3.get_width()//2, HEIGHT*0.32 + 120))
+        t1 = self._txt(self.font_big, "游戏结束", C_GOLD)
+        t2 = self._txt(self.font_mid, f"本局得分：{int(self.score)}", C_WHITE)
+        t3 = self._txt(self.font_mid, "按 R 重开 · Q 退出", C_DIM)
+        t1.draw(dstrect=(WIDTH//2 - t1.width//2, int(HEIGHT*0.32), t1.width, t1.height))
+        t2.draw(dstrect=(WIDTH//2 - t2.width//2, int(HEIGHT*0.32) + 70, t2.width, t2.height))
+        t3.draw(dstrect=(WIDTH//2 - t3.width//2, int(HEIGHT*0.32) + 120, t3.width, t3.height))
 
     def run(self):
+        # 累加器主循环：模拟以固定 DT_FIX 步进（确定性、与绘制开销无关），
+        # 渲染每帧一次
+        acc = 0.0
         while True:
-            dt = self.clock.tick(FPS) / 1000.0
+            frame_dt = min(self.clock.tick(FPS) / 1000.0, MAX_FRAME_TIME)
+            # 每帧只取一次时钟：update/draw 共用同一个 now，
+            # 既省去热路径里的重复系统调用，又保证两边的时间判断一致
+            now = self._now = time.perf_counter()
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     pygame.quit(); sys.exit()
@@ -428,7 +610,7 @@ class Game:
                         if event.key in (pygame.K_p, pygame.K_ESCAPE):
                             self.state = S_PAUSE
                         elif event.key == pygame.K_SPACE:
-                            self.player.try_dash(time.perf_counter())
+                            self.player.try_dash(now)
                     elif self.state == S_PAUSE:
                         if event.key in (pygame.K_p, pygame.K_ESCAPE):
                             self.state = S_PLAY
@@ -442,7 +624,14 @@ class Game:
                             pygame.quit(); sys.exit()
 
             if self.state == S_PLAY:
-                self.update(dt)
+                # 按键状态整帧不变，取一次供所有模拟步共用
+                keys = pygame.key.get_pressed()
+                acc += frame_dt
+                while acc >= DT_FIX:
+                    self.update(DT_FIX, now, keys)
+                    acc -= DT_FIX
+            else:
+                acc = 0.0  # 暂停/菜单期间不积累，恢复时不突进
 
             self.draw()
 